@@ -1,8 +1,94 @@
 from typing import List
+import warnings
 import numpy as np
 from .interval import interval
 
 NOTES_IN_MIDI = 128
+_PITCHES = np.arange(NOTES_IN_MIDI)
+_PITCHES.setflags(write=False)
+
+
+_SEMITONES_TO_SPECS = interval.semitones2intervals(
+    np.arange(-NOTES_IN_MIDI, NOTES_IN_MIDI)
+)  # row `semitones + NOTES_IN_MIDI` holds the specs of `semitones`
+_SEMITONES_TO_SPECS.setflags(write=False)
+
+
+_PACKED_SPECS_DTYPE = np.dtype(f"<u{interval.feature_dimensions}")
+
+
+def _pack_specs(intervals: np.ndarray) -> np.ndarray:
+    """
+    Packs the int8 specs of every interval into a single unsigned integer, so intervals can be compared as scalars.
+
+    The packed array is a view of the intervals whenever they are already C-contiguous int8.
+    """
+    intervals = np.ascontiguousarray(intervals, dtype=np.int8)
+    return intervals.view(_PACKED_SPECS_DTYPE)[:, 0]
+
+
+def _unpack_specs(packed_specs: np.ndarray) -> np.ndarray:
+    """
+    Inverse of `_pack_specs`; returns the int8 intervals of shape (?, interval.feature_dimensions).
+    """
+    return (
+        np.ascontiguousarray(packed_specs, dtype=_PACKED_SPECS_DTYPE)
+        .view(np.int8)
+        .reshape(-1, interval.feature_dimensions)
+    )
+
+
+def _as_contiguous(array: np.ndarray, name: str) -> np.ndarray:
+    """
+    Returns `array` as is if it is C-contiguous, so that reshaping it returns a view; otherwise warns and returns a
+    contiguous copy, since the reshape could not avoid copying anyway.
+    """
+    array = np.asarray(array)
+    if not array.flags.c_contiguous:
+        warnings.warn(
+            f"{name} is not C-contiguous, so it is copied before reshaping.",
+            stacklevel=3,
+        )
+        array = np.ascontiguousarray(array)
+    return array
+
+
+_SILENT_PACKED_SPECS = _pack_specs([interval.get_silence_specs_list()])[0]
+
+
+def _get_RLE_from_packed_specs(
+    packed_specs: np.ndarray, pixels_per_chunk: int | None = None
+) -> np.ndarray:
+    """
+    Run-Length Encodes a sequence of packed intervals. If `pixels_per_chunk` is given, runs are also broken at every
+    chunk boundary so the result can be split into the RLE of each chunk.
+    """
+    is_run_start = np.ones(len(packed_specs), dtype=bool)
+    is_run_start[1:] = (
+        packed_specs[1:] != packed_specs[:-1]
+    )  # a run starts wherever an interval differs from its predecessor
+    if pixels_per_chunk is not None:
+        is_run_start[::pixels_per_chunk] = True
+    run_starts = np.flatnonzero(is_run_start)
+
+    RLE = np.empty((len(run_starts), interval.feature_dimensions + 1), dtype=np.int32)
+    RLE[:, :-1] = _unpack_specs(packed_specs[run_starts])
+    RLE[:, -1] = np.diff(run_starts, append=len(packed_specs))
+    return RLE
+
+
+def _get_highest_pitch_notes(pianoroll: np.ndarray) -> np.ndarray:
+    """
+    Returns the highest active pitch of every timestep of a pianoroll, or 0 for silent timesteps.
+
+    Only a boolean mask of the pianoroll is built; the pianoroll itself is neither copied nor modified.
+    """
+    voiced = pianoroll != 0
+    notes = (
+        NOTES_IN_MIDI - 1 - np.argmax(voiced[:, ::-1], axis=1)
+    )  # argmax on the reversed pitch axis finds the highest active pitch
+    notes[~voiced.any(axis=1)] = 0
+    return notes
 
 
 class embedder:
@@ -73,22 +159,21 @@ class embedder:
         raise ValueError("Unrecognized variable name")
 
     def extract_highest_pitch_notes_from_pianoroll(
-        self, preserve_pianoroll: bool = True
+        self, preserve_pianoroll: bool | None = None
     ) -> np.ndarray:
         """
         Extracts the highest pitch note at each timestep from the pianoroll attribute.
 
         This method processes the `self.pianoroll` array to find the highest pitch note for each timestep.
-        It can operate in either a non-destructive mode, preserving the original pianoroll, or a faster,
-        destructive mode that alters the original data.
+        `self.pianoroll` is never modified.
 
         **Example:** Given the pianoroll of an SATB choir, returns Soprano notes.
 
         Parameters
         ----------
-        preserve_pianoroll : bool, optional
-            Determines if `self.pianoroll` should be preserved.
-            Setting it to False increases performance by avoiding data copying. Default is True.
+        preserve_pianoroll : bool | None, optional
+            Deprecated and ignored. The pianoroll is always preserved as the extraction neither copies nor alters it.
+            Passing any value other than None issues a DeprecationWarning.
 
         Raises
         ------
@@ -108,6 +193,13 @@ class embedder:
         The pianoroll format is expected to conform to MIDI standards with 128 pitches.
         """
 
+        if preserve_pianoroll is not None:
+            warnings.warn(
+                "preserve_pianoroll is deprecated and has no effect; the pianoroll is never modified.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         if self.pianoroll is None:
             raise TypeError("self.pianoroll is None.")
         if self.pianoroll.shape[1] != NOTES_IN_MIDI:
@@ -115,28 +207,7 @@ class embedder:
                 self._get_incompatible_dimension_error_message("pianoroll")
             )
 
-        if preserve_pianoroll:
-            pianoroll = np.copy(
-                self.pianoroll
-            )  # to make the process non-destructive and presereve the pianoroll
-        else:
-            pianoroll = (
-                self.pianoroll
-            )  # to make the process faster but in a destructive manner
-
-        pianoroll = pianoroll.astype(np.uint8)  # to prevent overflowing
-
-        np.clip(
-            pianoroll, 0, 1, out=pianoroll
-        )  # clipping is applied to ensure coef works as expected.
-
-        coef = np.arange(1, NOTES_IN_MIDI + 1, dtype=np.uint32)
-        for i in range(pianoroll.shape[0]):
-            pianoroll[i, :] *= coef
-            # coef is a constantly growing series. Its multiplication is needed to ensure the note with
-            # the highest pitch is selected in a chord.
-
-        return np.argmax(pianoroll, axis=1)
+        return _get_highest_pitch_notes(self.pianoroll)
 
     def get_melodic_intervals_from_pianoroll(
         self, pianoroll: np.ndarray | None = None
@@ -180,32 +251,27 @@ class embedder:
                 self._get_incompatible_dimension_error_message("pianoroll")
             )
 
-        notes = (
-            self.extract_highest_pitch_notes_from_pianoroll()
+        notes = _get_highest_pitch_notes(
+            self.pianoroll
         )  # first get the notes of the melody
 
         self.intervals = np.zeros(
             (len(notes), interval.feature_dimensions), dtype=np.int8
         )  # create the placeholder of intervals.
-        curser = interval()
-        last_voice_index = 0
-
-        silent_interval = interval.get_silence_specs_list()
-
-        if (
-            notes[0] == 0
-        ):  # if the first pixel is silence there is no interval to calculate
-            self.intervals[1] = silent_interval
-            # The first melodic interval is always zeros. This is becuase melody is calcualted with
-            # respect to the previous note.
-        for i in range(1, len(notes)):
-            if notes[i] == 0:  # it is silence and there is no interval to calculate
-                self.intervals[i] = silent_interval
-            else:
-                curser.semitones = notes[i] - notes[last_voice_index]
-                curser.semitone2interval()
-                self.intervals[i] = curser.get_specs_list()
-                last_voice_index = i
+        # The first melodic interval is always silence. This is becuase melody is calcualted with
+        # respect to the previous note.
+
+        voice_indices = np.where(notes != 0, np.arange(len(notes)), 0)
+        previous_voice_indices = np.maximum.accumulate(voice_indices)[
+            :-1
+        ]  # index of the last note before each timestep, or the first pixel if there is none
+        semitones = notes[1:] - notes[previous_voice_indices]
+
+        voiced = notes[1:] != 0
+        self.intervals[1:][voiced] = _SEMITONES_TO_SPECS[
+            semitones[voiced] + NOTES_IN_MIDI
+        ]
+        self.intervals[1:][~voiced] = interval.get_silence_specs_list()
         return self.intervals
 
     def get_pianoroll_from_melodic_intervals(
@@ -284,26 +350,16 @@ class embedder:
         )
         self.pianoroll[leading_silence, origin] = velocity
 
-        curser = interval()
-        curser.set_specs_list(self.intervals[leading_silence])
-        if not curser.is_silence():
-            origin += curser.interval2semitone()
-            if origin > 127 or origin < 0:
-                raise IndexError(self._get_range_error_message())
-            self.pianoroll[leading_silence + 1, origin] = velocity
-
-        semitones = 0
-        for i in range(leading_silence + 1, len(self.intervals)):
-            curser.set_specs_list(self.intervals[i])
-            if not curser.is_silence():
-                if not np.array_equal(
-                    self.intervals[i], self.intervals[i - 1]
-                ):  # if they are different calculate semitones, otherwise use prev value
-                    semitones = curser.interval2semitone()
-                origin += semitones
-                if origin > 127 or origin < 0:
-                    raise IndexError(self._get_range_error_message())
-                self.pianoroll[i + 1, origin] = velocity
+        steps = self.intervals[leading_silence:]
+        notes = origin + np.cumsum(
+            interval.intervals2semitones(steps)
+        )  # silent intervals are zero semitones, so they keep the previous note
+        voiced = _pack_specs(steps) != _SILENT_PACKED_SPECS
+        if np.any((notes[voiced] > 127) | (notes[voiced] < 0)):
+            raise IndexError(self._get_range_error_message())
+        self.pianoroll[np.flatnonzero(voiced) + leading_silence + 1, notes[voiced]] = (
+            velocity
+        )
 
         return self.pianoroll
 
@@ -353,27 +409,22 @@ class embedder:
                 self._get_incompatible_dimension_error_message("pianoroll")
             )
 
-        notes = self.extract_highest_pitch_notes_from_pianoroll()
+        notes = _get_highest_pitch_notes(self.pianoroll)
         self.intervals = np.zeros(
             (len(notes), interval.feature_dimensions), dtype=np.int8
-        )
-        curser = interval()
-
-        silent_interval = interval.get_silence_specs_list()
-
-        for i, note in enumerate(notes):
-            if note == 0:  # it is silence
-                self.intervals[i] = silent_interval
-            else:
-                ref_note = note - 1
-                while ref_note >= 0 and ref_pianoroll[i, ref_note] == 0:
-                    ref_note -= 1
-                if ref_note >= 0:
-                    curser.semitones = note - ref_note
-                    curser.semitone2interval()
-                    self.intervals[i] = curser.get_specs_list()
-                else:
-                    self.intervals[i] = silent_interval
+        )  # silence is represented by zeros, so only voiced timesteps need to be filled.
+
+        lower_ref_notes = (ref_pianoroll != 0) & (
+            _PITCHES < notes[:, np.newaxis]
+        )  # active reference notes strictly below the note of each timestep
+        ref_notes = (
+            NOTES_IN_MIDI - 1 - np.argmax(lower_ref_notes[:, ::-1], axis=1)
+        )  # argmax on the reversed pitch axis finds the highest of them
+        voiced = (notes != 0) & lower_ref_notes.any(axis=1)
+
+        self.intervals[voiced] = _SEMITONES_TO_SPECS[
+            notes[voiced] - ref_notes[voiced] + NOTES_IN_MIDI
+        ]
 
         return self.intervals
 
@@ -443,16 +494,16 @@ class embedder:
         if velocity > 127 or velocity < 0:
             raise IndexError(self._get_range_error_message())
 
-        ref_notes = self.extract_highest_pitch_notes_from_pianoroll()
+        ref_notes = _get_highest_pitch_notes(self.pianoroll)
         self.pianoroll = np.zeros((len(self.intervals), NOTES_IN_MIDI), dtype=np.uint8)
-        curser = interval()
-        for i, ref_note in enumerate(ref_notes):
-            if ref_note != 0:  # if it is not silence
-                curser.set_specs_list(self.intervals[i])
-                note = curser.interval2semitone()
-                if ref_note + note > 127 or ref_note + note < 0:
-                    raise IndexError(self._get_range_error_message())
-                self.pianoroll[i, ref_note + note] = velocity
+
+        voiced = (ref_notes != 0) & (
+            _pack_specs(self.intervals) != _SILENT_PACKED_SPECS
+        )  # skip timesteps where either the reference or the interval is silent
+        notes = ref_notes[voiced] + interval.intervals2semitones(self.intervals[voiced])
+        if np.any((notes > 127) | (notes < 0)):
+            raise IndexError(self._get_range_error_message())
+        self.pianoroll[np.flatnonzero(voiced), notes] = velocity
         return self.pianoroll
 
     def get_barwise_intervals_from_pianoroll(
@@ -504,68 +555,40 @@ class embedder:
         if pixels_per_bar < 1:
             raise ValueError("Number of pixels in bar must be a positive integer.")
 
-        notes = (
-            self.extract_highest_pitch_notes_from_pianoroll()
-        )  # get the notes of the melody
+        notes = _get_highest_pitch_notes(self.pianoroll)  # get the notes of the melody
         self.intervals = np.zeros(
             (len(notes), interval.feature_dimensions), dtype=np.int8
-        )  # create the placeholder of intervals.
+        )  # create the placeholder of intervals; silence is represented by zeros.
 
-        last_bar_ref_note = -1  # init with an impossible value
-        for note in notes:  # find first note
-            if note != 0:
-                last_bar_ref_note = note
-                break
+        number_of_bars = (
+            len(notes) // pixels_per_bar
+        )  # the pixels of an incomplete last bar are left silent
+        bars = notes[: number_of_bars * pixels_per_bar].reshape(
+            number_of_bars, pixels_per_bar
+        )
+        bar_numbers = np.flatnonzero(np.any(bars != 0, axis=1))  # skip empty bars
         if (
-            last_bar_ref_note == -1
+            len(bar_numbers) == 0
         ):  # this means all notes are 0; there is nothing to process
             return self.intervals
 
-        curser = interval()
-        silent_interval = interval.get_silence_specs_list()
-
-        for bar_number in range(int(len(notes) / pixels_per_bar)):  # traversing bars
-            if (
-                np.sum(
-                    notes[
-                        bar_number * pixels_per_bar : (bar_number + 1) * pixels_per_bar
-                    ]
-                )
-                == 0
-            ):  # bar is empty
-                continue
-
-            i = (
-                bar_number * pixels_per_bar
-            )  # init counter i with the first pixel of the bar
-            while (
-                i < (bar_number + 1) * pixels_per_bar and notes[i] == 0
-            ):  # finding the first note of the bar
-                self.intervals[i] = silent_interval
-                i += 1
-
-            if i < len(
-                notes
-            ):  # this ensures i does not exceed array boundaries which might happen at the last pixel of the last bar.
-                ref_note = notes[i]
-            else:
-                break
-
-            curser.semitones = (
-                ref_note - last_bar_ref_note
-            )  # finding the interval of the first note of the current bar with respect to the first note of the last bar
-            curser.semitone2interval()
-
-            self.intervals[i] = curser.get_specs_list()
-            last_bar_ref_note = ref_note
-
-            for i in range(i + 1, (bar_number + 1) * pixels_per_bar):
-                if notes[i] == 0:
-                    self.intervals[i] = silent_interval
-                else:
-                    curser.semitones = notes[i] - ref_note
-                    curser.semitone2interval()
-                    self.intervals[i] = curser.get_specs_list()
+        bars = bars[bar_numbers]
+        voiced = bars != 0
+        first_pixels = np.argmax(voiced, axis=1)
+        ref_notes = bars[np.arange(len(bars)), first_pixels]  # first note of each bar
+
+        semitones = (
+            bars - ref_notes[:, np.newaxis]
+        )  # intervals with respect to the first note of the bar
+        semitones[np.arange(len(bars)), first_pixels] = np.diff(
+            ref_notes, prepend=ref_notes[0]
+        )  # first notes of bars are calculated with respect to the first note of the previous bar
+
+        bar_intervals = _SEMITONES_TO_SPECS[semitones + NOTES_IN_MIDI]
+        bar_intervals[~voiced] = interval.get_silence_specs_list()
+        self.intervals[: number_of_bars * pixels_per_bar].reshape(
+            number_of_bars, pixels_per_bar, interval.feature_dimensions
+        )[bar_numbers] = bar_intervals
 
         return self.intervals
 
@@ -641,38 +664,28 @@ class embedder:
             raise IndexError(self._get_range_error_message())
 
         self.pianoroll = np.zeros((len(self.intervals), NOTES_IN_MIDI), dtype=np.uint8)
-        if origin > 127 or origin < 0:
-            raise IndexError(self._get_range_error_message())
         self.pianoroll[leading_silence, origin] = velocity
 
-        curser = interval()
-        last_known_origin = origin
-        origin_is_unkown = True
-        for i in range(leading_silence, len(self.intervals)):
-            if (
-                i % pixels_per_bar == 0
-            ):  # a new bar has started, we need to find its first note
-                origin_is_unkown = True
-
-            if origin_is_unkown:
-                # this is first note's interval of the current bar with respect to the first note of the last bar
-                curser.set_specs_list(self.intervals[i])
-                if not curser.is_silence():  # skip silences
-                    origin = (
-                        last_known_origin + curser.interval2semitone()
-                    )  # finding the first note of the current bar
-                    last_known_origin = origin
-                    if origin > 127 or origin < 0:
-                        raise IndexError(self._get_range_error_message())
-                    self.pianoroll[i, origin] = velocity
-                    origin_is_unkown = False
-            else:
-                curser.set_specs_list(self.intervals[i])
-                if not curser.is_silence():  # skip silences
-                    note = origin + curser.interval2semitone()
-                    if note > 127 or note < 0:
-                        raise IndexError(self._get_range_error_message())
-                    self.pianoroll[i, note] = velocity
+        steps = self.intervals[leading_silence:]
+        semitones = interval.intervals2semitones(steps)
+        voiced_steps = np.flatnonzero(_pack_specs(steps) != _SILENT_PACKED_SPECS)
+        if len(voiced_steps) == 0:
+            return self.pianoroll
+
+        bar_numbers = (voiced_steps + leading_silence) // pixels_per_bar
+        is_first_of_bar = np.ones(len(voiced_steps), dtype=bool)
+        is_first_of_bar[1:] = bar_numbers[1:] != bar_numbers[:-1]
+
+        bar_origins = origin + np.cumsum(
+            semitones[voiced_steps[is_first_of_bar]]
+        )  # first notes of bars are relative to the first note of the previous bar
+        notes = bar_origins[np.cumsum(is_first_of_bar) - 1] + np.where(
+            is_first_of_bar, 0, semitones[voiced_steps]
+        )  # other notes are relative to the first note of their bar
+        if np.any((notes > 127) | (notes < 0)):
+            raise IndexError(self._get_range_error_message())
+        self.pianoroll[voiced_steps + leading_silence, notes] = velocity
+
         return self.pianoroll
 
     def chunk_sequence_of_intervals(
@@ -720,14 +733,66 @@ class embedder:
         if pixels_per_chunk < 1:
             raise ValueError("Number of pixels in chunk must be a positive integer.")
 
-        return np.reshape(
-            intervals,
-            (
-                intervals.shape[0] // pixels_per_chunk,
-                pixels_per_chunk,
-                intervals.shape[1],
-            ),
-        )
+        return _as_contiguous(intervals, "intervals").reshape(
+            -1, pixels_per_chunk, intervals.shape[1]
+        )  # reshaping a contiguous array is guaranteed to return a view
+
+    def get_overlapping_chunks_of_intervals(
+        self,
+        intervals: np.ndarray | None = None,
+        pixels_per_chunk: int | None = None,
+        hop_size: int = 1,
+    ) -> np.ndarray:
+        """
+        Slides a window over a sequence of intervals and returns the overlapping chunks it covers.
+
+        Unlike `chunk_sequence_of_intervals`, consecutive chunks start `hop_size` pixels apart and may overlap. The
+        chunks are a read-only view of the intervals, so no data is copied regardless of the amount of overlap.
+
+        Parameters
+        ----------
+        intervals : ndarray, dtype=int8, shape=(?, interval.feature_dimensions)
+            Sequence of intervals to be chunked. If None, uses `self.intervals`.
+        pixels_per_chunk : int
+            Number of pixels in each chunk. Defaults to `self.pixels_per_bar` if None.
+        hop_size : int, default=1
+            Number of pixels between the starts of consecutive chunks.
+
+        Returns
+        -------
+        ndarray, dtype=int8
+            Read-only array of overlapping chunks. Shape is (?, pixels_per_chunk, interval.feature_dimensions),
+            where ? is the number of chunks.
+
+        Raises
+        ------
+        TypeError
+            If both `intervals` argument and `self.intervals` are None.
+        IndexError
+            If `intervals` shape's second dimension is not equal to `interval.feature_dimensions`.
+        ValueError
+            If `pixels_per_chunk` or `hop_size` is less than 1, or if `pixels_per_chunk` is greater than the number of
+            intervals.
+        """
+        if intervals is None:
+            intervals = self.intervals
+        if intervals is None:
+            raise TypeError(self._get_none_error_message("intervals"))
+        if intervals.shape[1] != interval().feature_dimensions:
+            raise IndexError(
+                self._get_incompatible_dimension_error_message("intervals")
+            )
+
+        if pixels_per_chunk is None:
+            pixels_per_chunk = self.pixels_per_bar
+        if pixels_per_chunk < 1:
+            raise ValueError("Number of pixels in chunk must be a positive integer.")
+        if hop_size < 1:
+            raise ValueError("Hop size must be a positive integer.")
+
+        return np.lib.stride_tricks.sliding_window_view(
+            intervals, pixels_per_chunk, axis=0
+        )[::hop_size].transpose(0, 2, 1)
 
     def merge_chunked_intervals(self, chunked_intervals: np.ndarray) -> np.ndarray:
         """
@@ -750,13 +815,9 @@ class embedder:
             entire sequence of intervals as a single continuous array.
 
         """
-        self.intervals = np.reshape(
-            chunked_intervals,
-            (
-                chunked_intervals.shape[0] * chunked_intervals.shape[1],
-                chunked_intervals.shape[2],
-            ),
-        )
+        self.intervals = _as_contiguous(chunked_intervals, "chunked_intervals").reshape(
+            -1, chunked_intervals.shape[2]
+        )  # reshaping a contiguous array is guaranteed to return a view
         return self.intervals
 
     def get_RLE_from_intervals(self, intervals: np.ndarray | None = None) -> np.ndarray:
@@ -798,22 +859,7 @@ class embedder:
                 self._get_incompatible_dimension_error_message("intervals")
             )
 
-        RLE = np.zeros(
-            (self.intervals.shape[0], self.intervals.shape[1] + 1), dtype=int
-        )
-
-        RLE[0, : self.intervals.shape[1]] = self.intervals[0]
-        RLE[0, -1] = 1
-        index = 0
-        for i in range(1, self.intervals.shape[0]):
-            if np.array_equal(self.intervals[i], self.intervals[i - 1]):
-                RLE[index, -1] += 1
-            else:
-                index += 1
-                RLE[index, : self.intervals.shape[1]] = self.intervals[i]
-                RLE[index, -1] = 1
-
-        return RLE[: index + 1, :]
+        return _get_RLE_from_packed_specs(_pack_specs(self.intervals))
 
     def get_intervals_from_RLE(self, RLE_data: np.ndarray) -> np.ndarray:
         """
@@ -835,20 +881,9 @@ class embedder:
             second dimension corresponds to interval features.
 
         """
-        s = np.sum(RLE_data, axis=0)
-        self.intervals = np.zeros((s[-1], len(s) - 1), dtype=np.int8)
-        index = 0
-        for i in range(RLE_data.shape[0]):
-            replacement = np.repeat(
-                RLE_data[i, : self.intervals.shape[1]], repeats=RLE_data[i, -1]
-            )
-            replacement = np.reshape(
-                replacement, (RLE_data[i, -1], self.intervals.shape[1]), order="F"
-            )
-            self.intervals[
-                index : index + RLE_data[i, -1], : self.intervals.shape[1]
-            ] = replacement
-            index += RLE_data[i, -1]
+        self.intervals = np.repeat(
+            RLE_data[:, :-1].astype(np.int8), repeats=RLE_data[:, -1], axis=0
+        )
         return self.intervals
 
     def get_RLE_from_intervals_bulk(
@@ -880,13 +915,23 @@ class embedder:
         get_intervals_from_RLE_bulk : Bulk decompresses Run-Length Encoded interval sequences.
 
         """
+        if bulk_intervals.shape[2] != interval.feature_dimensions:
+            raise IndexError(
+                self._get_incompatible_dimension_error_message("intervals")
+            )
 
-        RLE_bulk = []
+        if bulk_intervals.shape[0] == 0:
+            return []
 
-        for intervals in bulk_intervals:
-            RLE_bulk.append(self.get_RLE_from_intervals(intervals))
+        pixels_per_chunk = bulk_intervals.shape[1]
+        RLE = _get_RLE_from_packed_specs(
+            _pack_specs(bulk_intervals.reshape(-1, interval.feature_dimensions)),
+            pixels_per_chunk,
+        )  # the whole bulk is encoded at once, with runs broken at chunk boundaries
 
-        return RLE_bulk
+        run_starts = np.cumsum(RLE[:, -1]) - RLE[:, -1]
+        chunk_starts = np.arange(1, bulk_intervals.shape[0]) * pixels_per_chunk
+        return np.split(RLE, np.searchsorted(run_starts, chunk_starts))
 
     def get_intervals_from_RLE_bulk(
         self, bulk_RLE_data: List[np.ndarray]
@@ -907,23 +952,28 @@ class embedder:
 
         Returns
         -------
-        np.ndarray
+        np.ndarray, dtype=int8
             An ndarray of uncompressed intervals. The shape of the output array is
             (?, pixels_per_chunk, interval.feature_dimensions), where the first dimension represents
             chunks, the second dimension represents pixels in each chunk, and the third dimension
             represents interval features.
 
-        Notes
-        -----
-        The output size is inferred from the first chunk in the bulk RLE data.
+        Raises
+        ------
+        ValueError
+            If the chunks do not all uncompress to the same number of pixels.
 
         """
-        tmp = self.get_intervals_from_RLE(
-            bulk_RLE_data[0]
-        )  # just to identify the shape
-        bulk_intervals = np.zeros((len(bulk_RLE_data), tmp.shape[0], tmp.shape[1]))
-
-        for i, RLE_data in enumerate(bulk_RLE_data):
-            bulk_intervals[i] = self.get_intervals_from_RLE(RLE_data)
-
-        return bulk_intervals
+        if len(bulk_RLE_data) == 0:
+            return np.empty((0, 0, interval.feature_dimensions), dtype=np.int8)
+        if len({int(RLE_data[:, -1].sum()) for RLE_data in bulk_RLE_data}) > 1:
+            raise ValueError("All chunks must uncompress to the same number of pixels.")
+
+        RLE_data = np.concatenate(bulk_RLE_data)
+        bulk_intervals = np.repeat(
+            RLE_data[:, :-1].astype(np.int8), repeats=RLE_data[:, -1], axis=0
+        )  # all chunks are uncompressed at once and then separated
+
+        return bulk_intervals.reshape(
+            len(bulk_RLE_data), -1, interval.feature_dimensions
+        )
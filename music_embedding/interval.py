@@ -1,6 +1,150 @@
-from typing import Dict, List
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, List, Tuple
 import numpy as np
 
+# interval_order and interval_type of the remainder semitones (0-11), implementing the semitone-interval Q-table
+_ORDER_LUT = (1, 2, 2, 3, 3, 4, 5, 5, 6, 6, 7, 7)
+_TYPE_LUT = (0, -1, 1, -1, 1, 0, -2, 0, -1, 1, -1, 1)
+# semitones of each interval_order (rows, 0-7) and interval_type (columns, -2 to 2) within a single octave
+_SEMI_LUT = (
+    (0, 0, 0, 0, 0),
+    (-1, 0, 0, 0, 1),
+    (0, 1, 2, 2, 3),
+    (2, 3, 4, 4, 5),
+    (4, 5, 5, 5, 6),
+    (6, 7, 7, 7, 8),
+    (7, 8, 9, 9, 10),
+    (9, 10, 11, 11, 12),
+)
+_ORDER_LUT_NP = np.array(_ORDER_LUT, dtype=np.int8)
+_TYPE_LUT_NP = np.array(_TYPE_LUT, dtype=np.int8)
+_ORDER_LUT_NP.setflags(write=False)
+_TYPE_LUT_NP.setflags(write=False)
+_SEMI_LUT_NP = np.array(_SEMI_LUT, dtype=np.int8)
+_SEMI_LUT_NP.setflags(write=False)
+# valid ranges of [interval_order, interval_type, is_descending, octave_offset], as enforced by set_specs_list
+_SPECS_LOWER_BOUNDS = np.array([0, -2, 0, 0])
+_SPECS_UPPER_BOUNDS = np.array([7, 2, 1, 9])
+_SILENCE_SPECS = (0, 0, 0, 0)
+# interval characteristics in the same order as get_specs_list, so it can be passed to set_specs_list as is
+IntervalSpecs = namedtuple(
+    "IntervalSpecs",
+    ["interval_order", "interval_type", "is_descending", "octave_offset"],
+)
+# name prefix of each interval_type (-2 to 2)
+_QUALITY_NAMES = ("dim ", "min ", "perfect ", "Maj ", "Aug ")
+# one-hot encodings of each interval_order (1-7) and interval_type (-2 to 2)
+_ONE_HOT_ORDERS = tuple(tuple(int(i == j) for j in range(7)) for i in range(7))
+_ONE_HOT_TYPES = tuple(tuple(int(i == j) for j in range(5)) for i in range(5))
+_ONE_HOT_ORDERS_NP = np.array(_ONE_HOT_ORDERS, dtype=np.int8)
+_ONE_HOT_TYPES_NP = np.array(_ONE_HOT_TYPES, dtype=np.int8)
+_ONE_HOT_ORDERS_NP.setflags(write=False)
+_ONE_HOT_TYPES_NP.setflags(write=False)
+
+
+def _ordinal(n: int) -> str:
+    """
+    Returns the ordinal number of `n` as a string, e.g. 1st, 2nd, 3rd and 4th.
+    """
+    return "%d%s" % (
+        n,
+        "tsnrhtdd"[(n // 10 % 10 != 1) * (n % 10 < 4) * n % 10 :: 4],
+    )  # adopted from https://codegolf.stackexchange.com/questions/4707/outputting-ordinal-numbers-1st-2nd-3rd#answer-4712
+
+
+# ordinal names of every interval up to 7th with an octave_offset of 10, i.e. up to 127 // 12 as MIDI allows
+_ORDINALS = tuple(_ordinal(n) for n in range(7 + 10 * 7 + 1))
+
+
+@lru_cache(maxsize=256)
+def _semitone_to_interval(semitones: int) -> Tuple[int, int, int, int]:
+    """
+    Returns the (interval_order, interval_type, is_descending, octave_offset) specs of a semitone distance; memoized
+    since the semitone distances between MIDI notes are limited to the -127 to 127 range.
+    """
+    semitones = int(semitones)  # floats cannot index the lookup tables
+    is_descending = 1 if semitones < 0 else 0
+    octave_offset, remainder_semitones = divmod(
+        abs(semitones), 12
+    )  # becuase 12th semitone is the octave
+    return (
+        _ORDER_LUT[remainder_semitones],  # implementing Q-table
+        _TYPE_LUT[remainder_semitones],
+        is_descending,
+        octave_offset,
+    )
+
+
+def _interval_to_semitone(
+    interval_order: int, interval_type: int, is_descending: int, octave_offset: int
+) -> int:
+    """
+    Returns the number of semitones of an interval, negative if the interval is descending.
+    """
+    semitones = (
+        _SEMI_LUT[int(interval_order)][int(interval_type) + 2] + octave_offset * 12
+    )  # 2 is added to get the index; octave is 12 semitones
+    return -semitones if is_descending == 1 else semitones
+
+
+@lru_cache(maxsize=4096)
+def _format_name(
+    interval_order: int, interval_type: int, is_descending: int, octave_offset: int
+) -> str:
+    """
+    Returns the name of an interval; memoized since a piece only ever uses a few hundred distinct intervals.
+    """
+    if (interval_order, interval_type, is_descending, octave_offset) == _SILENCE_SPECS:
+        return "Silence"
+
+    direction = "Descending " if is_descending else ""
+    quality = _QUALITY_NAMES[
+        interval_type + 2
+    ]  # 2 is added to get the index; index starts at 0 while type starts at -2
+    return f"{direction}{quality}{_ORDINALS[interval_order + octave_offset * 7]}"
+
+
+def _raise_bad_specs(
+    interval_order: int, interval_type: int, is_descending: int, octave_offset: int
+) -> None:
+    """
+    Raises a ValueError describing the first interval characteristic that is out of its valid range.
+    """
+    if interval_order > 7 or interval_order < 0:
+        raise ValueError("interval_order must be between 0 and 7 (inclusive).")
+    if interval_type > 2 or interval_type < -2:
+        raise ValueError("interval_type must be between -2 and 2 (inclusive).")
+    if is_descending < 0 or is_descending > 1:
+        raise ValueError("is_descending must be either 0 or 1.")
+    if octave_offset < 0 or octave_offset > 9:
+        raise ValueError("octave_offset must be between 0 and 9 (inclusive).")
+
+
+def _hot_index(scores: List[float]) -> int:
+    """
+    Returns the index of the highest score, i.e. what `np.argmax` returns; a list or tuple whose highest score is
+    exactly 1, such as a one-hot encoding, is searched with `index` to avoid converting it to an array.
+    """
+    if isinstance(scores, (list, tuple)) and max(scores) == 1:
+        return scores.index(
+            1
+        )  # the first 1 is the first occurrence of the maximum, as with argmax
+    return int(np.argmax(scores))
+
+
+def _check_intervals(intervals: np.ndarray) -> None:
+    """
+    Raises the same ValueError as `interval.set_specs_list` for the first interval of an array that is out of range.
+    """
+    out_of_range = np.any(
+        (intervals < _SPECS_LOWER_BOUNDS) | (intervals > _SPECS_UPPER_BOUNDS), axis=-1
+    )
+    if out_of_range.any():
+        _raise_bad_specs(
+            *intervals[np.unravel_index(np.argmax(out_of_range), out_of_range.shape)]
+        )
+
 
 class interval:
     """
@@ -28,6 +172,13 @@ class interval:
     converting between semitone distances and interval qualities.
     """
 
+    __slots__ = (
+        "interval_order",
+        "interval_type",
+        "octave_offset",
+        "is_descending",
+        "semitones",
+    )
     feature_dimensions = 4
 
     def __init__(
@@ -44,7 +195,9 @@ class interval:
         self.is_descending: int = is_descending
         self.semitones: int = semitones
 
-    def semitone2interval(self, semitones: int | None = None) -> Dict[str, int]:
+    def semitone2interval(
+        self, semitones: int | None = None, return_dict: bool = True
+    ) -> Dict[str, int] | IntervalSpecs:
         """
         Calculates the interval characteristics based on their semitone distance. If the 'semitones' argument
         is provided, it updates the instance's 'semitones' attribute before calculating the interval.
@@ -72,63 +225,30 @@ class interval:
         ----------
         semitones : int | None, default=None
             The number of semitones in the interval. If provided, updates the instance's 'semitones' attribute.
+        return_dict : bool, default=True
+            If False, returns an `IntervalSpecs` namedtuple instead of building a dictionary.
 
         Returns
         -------
-        dict
+        dict | IntervalSpecs
             A dictionary with the updated interval characteristics: 'interval_order', 'interval_type',
-            'octave_offset', and 'is_descending'.
+            'octave_offset', and 'is_descending'. If `return_dict` is False, the same characteristics as an
+            `IntervalSpecs` in the order of `get_specs_list`.
         """
         if semitones is not None:
             self.semitones = semitones
 
-        self.is_descending = 0
-        if self.semitones < 0:
-            self.is_descending = 1
-            self.semitones = -self.semitones
-
-        self.octave_offset = self.semitones // 12  # becuase 12th semitone is the octave
-        remainder_semitones = self.semitones % 12
-
-        self.interval_order = 1
-        self.interval_type = 0
-        if remainder_semitones == 0:  # implementing Q-table
-            self.interval_order = 1
-            self.interval_type = 0
-        elif remainder_semitones == 1:
-            self.interval_order = 2
-            self.interval_type = -1
-        elif remainder_semitones == 2:
-            self.interval_order = 2
-            self.interval_type = 1
-        elif remainder_semitones == 3:
-            self.interval_order = 3
-            self.interval_type = -1
-        elif remainder_semitones == 4:
-            self.interval_order = 3
-            self.interval_type = 1
-        elif remainder_semitones == 5:
-            self.interval_order = 4
-            self.interval_type = 0
-        elif remainder_semitones == 6:
-            self.interval_order = 5
-            self.interval_type = -2
-        elif remainder_semitones == 7:
-            self.interval_order = 5
-            self.interval_type = 0
-        elif remainder_semitones == 8:
-            self.interval_order = 6
-            self.interval_type = -1
-        elif remainder_semitones == 9:
-            self.interval_order = 6
-            self.interval_type = 1
-        elif remainder_semitones == 10:
-            self.interval_order = 7
-            self.interval_type = -1
-        elif remainder_semitones == 11:
-            self.interval_order = 7
-            self.interval_type = 1
-
+        self._set_specs_fast(
+            *_semitone_to_interval(int(self.semitones))
+        )  # the cache is keyed on plain ints; self.semitones keeps its sign, so calling again is stable
+
+        if not return_dict:
+            return IntervalSpecs(
+                self.interval_order,
+                self.interval_type,
+                self.is_descending,
+                self.octave_offset,
+            )
         return {
             "interval_order": self.interval_order,
             "interval_type": self.interval_type,
@@ -168,101 +288,143 @@ class interval:
         if specs is not None:
             self.set_specs_list(specs)
 
-        self.semitones = 0
-
-        if self.interval_order == 1:
-            if self.interval_type == -2:
-                self.semitones = -1
-            elif self.interval_type == -1:
-                self.semitones = 0
-            elif self.interval_type == 0:
-                self.semitones = 0
-            elif self.interval_type == 1:
-                self.semitones = 0
-            elif self.interval_type == 2:
-                self.semitones = 1
-
-        elif self.interval_order == 2:
-            if self.interval_type == -2:
-                self.semitones = 0
-            elif self.interval_type == -1:
-                self.semitones = 1
-            elif self.interval_type == 0:
-                self.semitones = 2
-            elif self.interval_type == 1:
-                self.semitones = 2
-            elif self.interval_type == 2:
-                self.semitones = 3
-
-        elif self.interval_order == 3:
-            if self.interval_type == -2:
-                self.semitones = 2
-            elif self.interval_type == -1:
-                self.semitones = 3
-            elif self.interval_type == 0:
-                self.semitones = 4
-            elif self.interval_type == 1:
-                self.semitones = 4
-            elif self.interval_type == 2:
-                self.semitones = 5
-
-        elif self.interval_order == 4:
-            if self.interval_type == -2:
-                self.semitones = 4
-            elif self.interval_type == -1:
-                self.semitones = 5
-            elif self.interval_type == 0:
-                self.semitones = 5
-            elif self.interval_type == 1:
-                self.semitones = 5
-            elif self.interval_type == 2:
-                self.semitones = 6
-
-        elif self.interval_order == 5:
-            if self.interval_type == -2:
-                self.semitones = 6
-            elif self.interval_type == -1:
-                self.semitones = 7
-            elif self.interval_type == 0:
-                self.semitones = 7
-            elif self.interval_type == 1:
-                self.semitones = 7
-            elif self.interval_type == 2:
-                self.semitones = 8
-
-        elif self.interval_order == 6:
-            if self.interval_type == -2:
-                self.semitones = 7
-            elif self.interval_type == -1:
-                self.semitones = 8
-            elif self.interval_type == 0:
-                self.semitones = 9
-            elif self.interval_type == 1:
-                self.semitones = 9
-            elif self.interval_type == 2:
-                self.semitones = 10
-
-        elif self.interval_order == 7:
-            if self.interval_type == -2:
-                self.semitones = 9
-            elif self.interval_type == -1:
-                self.semitones = 10
-            elif self.interval_type == 0:
-                self.semitones = 11
-            elif self.interval_type == 1:
-                self.semitones = 11
-            elif self.interval_type == 2:
-                self.semitones = 12
-
-        self.semitones += (
-            self.octave_offset * 12
-        )  # adds multiplies of 12 to semitones becuase octave is 12 semitones
-
-        if self.is_descending == 1:
-            self.semitones = -self.semitones
-
+        self.semitones = _interval_to_semitone(
+            self.interval_order,
+            self.interval_type,
+            self.is_descending,
+            self.octave_offset,
+        )
         return int(self.semitones)
 
+    @staticmethod
+    def semitones2intervals(semitones: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of `semitone2interval`, converting a whole array of semitone distances at once.
+
+        Parameters
+        ----------
+        semitones : np.ndarray
+            Array of semitone distances; negative values represent descending intervals.
+
+        Returns
+        -------
+        np.ndarray
+            An int8 array with an extra trailing axis of size `interval.feature_dimensions` holding the specs of each
+            interval in the following order: [interval_order, interval_type, is_descending, octave_offset]
+        """
+        semitones = np.asarray(semitones)
+        octave_offset, remainder_semitones = np.divmod(np.abs(semitones), 12)
+        intervals = np.empty(
+            semitones.shape + (interval.feature_dimensions,), dtype=np.int8
+        )
+        intervals[..., 0] = _ORDER_LUT_NP[remainder_semitones]  # implementing Q-table
+        intervals[..., 1] = _TYPE_LUT_NP[remainder_semitones]
+        intervals[..., 2] = semitones < 0
+        intervals[..., 3] = octave_offset
+        return intervals
+
+    @staticmethod
+    def intervals2semitones(intervals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of `interval2semitone`, converting a whole array of intervals at once.
+
+        Parameters
+        ----------
+        intervals : np.ndarray
+            Array whose last axis has size `interval.feature_dimensions` and holds the specs of each interval in the
+            following order: [interval_order, interval_type, is_descending, octave_offset]
+
+        Returns
+        -------
+        np.ndarray
+            An int32 array with the number of semitones in each interval; the trailing feature axis is dropped.
+
+        Raises
+        ------
+        ValueError
+            If any of the intervals is out of range; the message is the same as the one of `set_specs_list`.
+        """
+        intervals = np.asarray(intervals)
+        _check_intervals(intervals)
+
+        specs = intervals.astype(np.intp)
+        semitones = _SEMI_LUT_NP[specs[..., 0], specs[..., 1] + 2].astype(np.int32)
+        semitones += specs[..., 3] * 12  # because octave is 12 semitones
+        return np.where(specs[..., 2] == 1, -semitones, semitones)
+
+    @staticmethod
+    def intervals2one_hot(intervals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of `get_one_hot_specs_list`, encoding a whole array of intervals at once.
+
+        Parameters
+        ----------
+        intervals : np.ndarray
+            Array whose last axis has size `interval.feature_dimensions` and holds the specs of each interval in the
+            following order: [interval_order, interval_type, is_descending, octave_offset]
+
+        Returns
+        -------
+        np.ndarray
+            An int8 array whose last axis has size 14: the one-hot interval_order (7), the one-hot interval_type (5),
+            is_descending and octave_offset, in the same order as the keys of `get_one_hot_specs_list`.
+
+        Raises
+        ------
+        ValueError
+            If any of the intervals is out of range; the message is the same as the one of `set_specs_list`.
+        """
+        intervals = np.asarray(intervals)
+        _check_intervals(intervals)
+        one_hot = np.empty(intervals.shape[:-1] + (14,), dtype=np.int8)
+        one_hot[..., :7] = _ONE_HOT_ORDERS_NP[
+            intervals[..., 0] - 1
+        ]  # 1 is subtracted to get the index; index starts at 0 while order starts at 1
+        one_hot[..., 7:12] = _ONE_HOT_TYPES_NP[
+            intervals[..., 1] + 2
+        ]  # 2 is added to get the index; index starts at 0 while type starts at -2
+        one_hot[..., 12] = intervals[..., 2]
+        one_hot[..., 13] = intervals[..., 3]
+        return one_hot
+
+    @staticmethod
+    def one_hot2intervals(one_hot: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of `set_one_hot_specs_list`, decoding a whole array of one-hot intervals at once.
+
+        Parameters
+        ----------
+        one_hot : np.ndarray
+            Array whose last axis has size 14, laid out as returned by `intervals2one_hot`. The interval_order and
+            interval_type blocks may also hold scores; the largest one is taken, as in `set_one_hot_specs_list`.
+
+        Returns
+        -------
+        np.ndarray
+            An int8 array with the specs of each interval along the last axis, in the following order:
+            [interval_order, interval_type, is_descending, octave_offset]
+
+        Raises
+        ------
+        ValueError
+            If any is_descending or octave_offset is out of range; the message is the same as the one of
+            `set_specs_list`.
+        """
+        one_hot = np.asarray(one_hot)
+        intervals = np.empty(
+            one_hot.shape[:-1] + (interval.feature_dimensions,), dtype=np.int8
+        )
+        intervals[..., 0] = (
+            np.argmax(one_hot[..., :7], axis=-1) + 1
+        )  # 1 is added to get the index; index starts at 0 while order starts at 1
+        intervals[..., 1] = (
+            np.argmax(one_hot[..., 7:12], axis=-1) - 2
+        )  # 2 is subtracted to get the index; index starts at 0 while type starts at -2
+        intervals[..., 2:] = one_hot[..., 12:]
+
+        _check_intervals(intervals)
+        return intervals
+
     def is_silence(self) -> bool:
         """
         Determines if the interval represents silence, based on its specifications.
@@ -274,7 +436,12 @@ class interval:
         bool
             True if the interval represents silence, False otherwise.
         """
-        return np.array_equal(self.get_specs_list(), interval.get_silence_specs_list())
+        return bool(
+            self.interval_order == 0
+            and self.interval_type == 0
+            and self.is_descending == 0
+            and self.octave_offset == 0
+        )  # NumPy specs would otherwise leak a np.bool_
 
     def get_specs_list(self) -> List[int]:
         """
@@ -331,20 +498,37 @@ class interval:
             is_descending = specs[2]
             octave_offset = specs[3]
 
-        if interval_order > 7 or interval_order < 0:
-            raise ValueError("interval_order must be between 0 and 7 (inclusive).")
-        if interval_type > 2 or interval_type < -2:
-            raise ValueError("interval_type must be between -2 and 2 (inclusive).")
-        if is_descending < 0 or is_descending > 1:
-            raise ValueError("is_descending must be either 0 or 1.")
-        if octave_offset < 0 or octave_offset > 9:
-            raise ValueError("octave_offset must be between 0 and 9 (inclusive).")
+        if not (
+            0 <= interval_order <= 7
+            and -2 <= interval_type <= 2
+            and 0 <= is_descending <= 1
+            and 0 <= octave_offset <= 9
+        ):  # a single branch on the valid path; the failing characteristic is only looked up on error
+            _raise_bad_specs(
+                interval_order, interval_type, is_descending, octave_offset
+            )
 
         self.interval_order = interval_order
         self.interval_type = interval_type
         self.is_descending = is_descending
         self.octave_offset = octave_offset
 
+    def _set_specs_fast(
+        self,
+        interval_order: int,
+        interval_type: int,
+        is_descending: int,
+        octave_offset: int,
+    ) -> None:
+        """
+        Sets the interval's characteristics without validation; only for values computed internally, e.g. by
+        `_semitone_to_interval`, as opposed to values passed in by callers.
+        """
+        self.interval_order = interval_order
+        self.interval_type = interval_type
+        self.is_descending = is_descending
+        self.octave_offset = octave_offset
+
     def get_one_hot_specs_list(self) -> Dict[str, List[int] | int | bool]:
         """
         Provides a one-hot encoding of the interval's order and type, and represents the descending status and
@@ -357,17 +541,13 @@ class interval:
             status as a boolean, and the octave offset as an integer. Keys are 'interval_order', 'interval_type',
             'is_descending', and 'octave_offset'.
         """
-        interval_order = [0] * 7
-        interval_type = [0] * 5
-        interval_order[
-            self.interval_order - 1
-        ] = 1  # 1 is subtracted to get the index; index starts at 0 while order starts at 1
-        interval_type[
-            self.interval_type + 2
-        ] = 1  # 2 is added to get the index; index starts at 0 while type starts at -2
         return {
-            "interval_order": interval_order,
-            "interval_type": interval_type,
+            "interval_order": list(
+                _ONE_HOT_ORDERS[self.interval_order - 1]
+            ),  # 1 is subtracted to get the index; index starts at 0 while order starts at 1
+            "interval_type": list(
+                _ONE_HOT_TYPES[self.interval_type + 2]
+            ),  # 2 is added to get the index; index starts at 0 while type starts at -2
             "is_descending": self.is_descending,
             "octave_offset": self.octave_offset,
         }
@@ -398,10 +578,10 @@ class interval:
 
         """
         interval_order = (
-            np.argmax(interval_order) + 1
+            _hot_index(interval_order) + 1
         )  # 1 is added to get the index; index starts at 0 while order starts at 1
         interval_type = (
-            np.argmax(interval_type) - 2
+            _hot_index(interval_type) - 2
         )  # 2 is subtracted to get the index; index starts at 0 while type starts at -2
         self.set_specs_list(
             [interval_order, interval_type, is_descending, octave_offset]
@@ -421,7 +601,7 @@ class interval:
             A list of integers representing silence, with all elements set to zero.
 
         """
-        return [0] * interval().feature_dimensions
+        return list(_SILENCE_SPECS)
 
     def get_name(self, semitones: int | None = None) -> str:
         """
@@ -448,28 +628,30 @@ class interval:
             self.semitones = semitones
             self.semitone2interval()
 
-        if self.is_silence():
-            return "Silence"
-
-        output = ""
-        if self.is_descending:
-            output += "Descending "
-        if self.interval_type == -2:
-            output += "dim "
-        elif self.interval_type == -1:
-            output += "min "
-        elif self.interval_type == 0:
-            output += "perfect "
-        elif self.interval_type == 1:
-            output += "Maj "
-        elif self.interval_type == 2:
-            output += "Aug "
-        ordinal = lambda n: "%d%s" % (
-            n,
-            "tsnrhtdd"[(n // 10 % 10 != 1) * (n % 10 < 4) * n % 10 :: 4],
-        )  # adopted from https://codegolf.stackexchange.com/questions/4707/outputting-ordinal-numbers-1st-2nd-3rd#answer-4712
-        output += ordinal(self.interval_order + self.octave_offset * 7)
-        return output
+        return _format_name(
+            self.interval_order,
+            self.interval_type,
+            self.is_descending,
+            self.octave_offset,
+        )
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        Returns the interval's characteristics as an int8 array in the order of `get_specs_list`, so intervals can
+        be passed to NumPy and to the batch conversions directly, e.g. `np.array(list_of_intervals)`.
+
+        Raises
+        ------
+        ValueError
+            If `copy` is False; the specs are not stored in an array, so a new one is always created.
+        """
+        if copy is False:
+            raise ValueError(
+                "Unable to avoid copy while creating an array as requested."
+            )
+        return np.array(
+            self.get_specs_list(), dtype=np.int8 if dtype is None else dtype
+        )
 
     def __str__(self):
         return self.get_name()
@@ -3,6 +3,43 @@ from music_embedding.embedder import embedder
 import pytest
 import numpy as np
 
+SEED = 0xC0FFEE  # each test draws from its own generator so its data does not depend on test order
+# read-only inputs shared by the invalid argument cases, all of which raise before writing anything
+ZEROS = {
+    shape: np.zeros(shape)
+    for shape in [
+        (1, 1),
+        (1, 128),
+        (1, 150),
+        (1, interval.feature_dimensions - 1),
+        (1, interval.feature_dimensions),
+        (1, interval.feature_dimensions + 1),
+    ]
+}
+for array in ZEROS.values():
+    array.setflags(write=False)
+
+
+@pytest.fixture(scope="module")
+def melodic_pianoroll():
+    pianoroll = np.zeros((128, 128), dtype=np.int8)
+    np.fill_diagonal(pianoroll, 100)
+
+    csum = np.cumsum(np.arange(15))
+    silent = np.concatenate([csum[i] + np.arange(i) for i in range(15)])
+    pianoroll[silent, silent] = 0
+    pianoroll.setflags(write=False)
+    return pianoroll
+
+
+@pytest.fixture(scope="module")
+def random_intervals():
+    intervals = np.random.default_rng(SEED).integers(
+        low=-2, high=2, size=(960, 4), dtype=np.int8
+    )
+    intervals.setflags(write=False)
+    return intervals
+
 
 # TODO implement a function that checks the variables for any problems.
 def test__get_none_error_message():
@@ -35,415 +72,423 @@ def test__get_incompatible_dimension_error_message():
         emb._get_incompatible_dimension_error_message("invalid_input")
 
 
-def test_invalid_argument_handling():
-    # extract_highest_pitch_notes_from_pianoroll
-    emb = embedder()
-    with pytest.raises(TypeError):
-        emb.extract_highest_pitch_notes_from_pianoroll()
-
-    emb.pianoroll = np.zeros((1, 1))
-    with pytest.raises(IndexError):
-        emb.extract_highest_pitch_notes_from_pianoroll()
-
-    # get_melodic_intervals_from_pianoroll
-    emb.pianoroll = None
-    with pytest.raises(TypeError):
-        emb.get_melodic_intervals_from_pianoroll()
-
-    emb.pianoroll = np.zeros((1, 1))
-    with pytest.raises(IndexError):
-        emb.get_melodic_intervals_from_pianoroll()
-
-    emb.pianoroll = np.zeros((1, 150))
-    with pytest.raises(IndexError):
-        emb.get_melodic_intervals_from_pianoroll()
-
-    # get_pianoroll_from_melodic_intervals
-    emb.intervals = None
-    with pytest.raises(TypeError):
-        emb.get_pianoroll_from_melodic_intervals()
+@pytest.mark.parametrize(
+    ("attributes", "method", "kwargs", "exception"),
+    [
+        # extract_highest_pitch_notes_from_pianoroll
+        ({}, "extract_highest_pitch_notes_from_pianoroll", {}, TypeError),
+        (
+            {"pianoroll": ZEROS[1, 1]},
+            "extract_highest_pitch_notes_from_pianoroll",
+            {},
+            IndexError,
+        ),
+        # get_melodic_intervals_from_pianoroll
+        ({}, "get_melodic_intervals_from_pianoroll", {}, TypeError),
+        (
+            {"pianoroll": ZEROS[1, 1]},
+            "get_melodic_intervals_from_pianoroll",
+            {},
+            IndexError,
+        ),
+        (
+            {"pianoroll": ZEROS[1, 150]},
+            "get_melodic_intervals_from_pianoroll",
+            {},
+            IndexError,
+        ),
+        # get_pianoroll_from_melodic_intervals
+        ({}, "get_pianoroll_from_melodic_intervals", {}, TypeError),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions - 1]},
+            "get_pianoroll_from_melodic_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions + 1]},
+            "get_pianoroll_from_melodic_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions]},
+            "get_pianoroll_from_melodic_intervals",
+            {"leading_silence": 2},
+            ValueError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions], "origin": 128},
+            "get_pianoroll_from_melodic_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions]},
+            "get_pianoroll_from_melodic_intervals",
+            {"origin": -1},
+            IndexError,
+        ),
+        (
+            {
+                "intervals": ZEROS[1, interval.feature_dimensions],
+                "default_velocity": 128,
+            },
+            "get_pianoroll_from_melodic_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions]},
+            "get_pianoroll_from_melodic_intervals",
+            {"velocity": -1},
+            IndexError,
+        ),
+        # get_harmonic_intervals_from_pianoroll
+        (
+            {},
+            "get_harmonic_intervals_from_pianoroll",
+            {"ref_pianoroll": ZEROS[1, 128]},
+            TypeError,
+        ),
+        (
+            {"pianoroll": ZEROS[1, 1]},
+            "get_harmonic_intervals_from_pianoroll",
+            {"ref_pianoroll": ZEROS[1, 128]},
+            IndexError,
+        ),
+        (
+            {"pianoroll": ZEROS[1, 150]},
+            "get_harmonic_intervals_from_pianoroll",
+            {"ref_pianoroll": ZEROS[1, 128]},
+            IndexError,
+        ),
+        (
+            {"pianoroll": ZEROS[1, 128]},
+            "get_harmonic_intervals_from_pianoroll",
+            {"ref_pianoroll": ZEROS[1, 1]},
+            IndexError,
+        ),
+        (
+            {"pianoroll": ZEROS[1, 128]},
+            "get_harmonic_intervals_from_pianoroll",
+            {"ref_pianoroll": ZEROS[1, 150]},
+            IndexError,
+        ),
+        # get_pianoroll_from_harmonic_intervals
+        (
+            {"pianoroll": ZEROS[1, 128]},
+            "get_pianoroll_from_harmonic_intervals",
+            {},
+            TypeError,
+        ),
+        (
+            {
+                "pianoroll": ZEROS[1, 128],
+                "intervals": ZEROS[1, interval.feature_dimensions - 1],
+            },
+            "get_pianoroll_from_harmonic_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {
+                "pianoroll": ZEROS[1, 128],
+                "intervals": ZEROS[1, interval.feature_dimensions + 1],
+            },
+            "get_pianoroll_from_harmonic_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {
+                "pianoroll": ZEROS[1, 128],
+                "intervals": ZEROS[1, interval.feature_dimensions],
+                "default_velocity": 128,
+            },
+            "get_pianoroll_from_harmonic_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {
+                "pianoroll": ZEROS[1, 128],
+                "intervals": ZEROS[1, interval.feature_dimensions],
+            },
+            "get_pianoroll_from_harmonic_intervals",
+            {"velocity": -1},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions]},
+            "get_pianoroll_from_harmonic_intervals",
+            {},
+            TypeError,
+        ),
+        (
+            {
+                "pianoroll": ZEROS[1, 1],
+                "intervals": ZEROS[1, interval.feature_dimensions],
+            },
+            "get_pianoroll_from_harmonic_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {
+                "pianoroll": ZEROS[1, 150],
+                "intervals": ZEROS[1, interval.feature_dimensions],
+            },
+            "get_pianoroll_from_harmonic_intervals",
+            {},
+            IndexError,
+        ),
+        # get_barwise_intervals_from_pianoroll
+        ({}, "get_barwise_intervals_from_pianoroll", {}, TypeError),
+        (
+            {"pianoroll": ZEROS[1, 1]},
+            "get_barwise_intervals_from_pianoroll",
+            {},
+            IndexError,
+        ),
+        (
+            {"pianoroll": ZEROS[1, 150]},
+            "get_barwise_intervals_from_pianoroll",
+            {},
+            IndexError,
+        ),
+        (
+            {"pianoroll": ZEROS[1, 128], "pixels_per_bar": 0},
+            "get_barwise_intervals_from_pianoroll",
+            {},
+            ValueError,
+        ),
+        (
+            {"pianoroll": ZEROS[1, 128]},
+            "get_barwise_intervals_from_pianoroll",
+            {"pixels_per_bar": -1},
+            ValueError,
+        ),
+        # get_pianoroll_from_barwise_intervals
+        (
+            {
+                "intervals": ZEROS[1, interval.feature_dimensions],
+                "pixels_per_bar": 0,
+            },
+            "get_pianoroll_from_barwise_intervals",
+            {},
+            ValueError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions]},
+            "get_pianoroll_from_barwise_intervals",
+            {"pixels_per_bar": -1},
+            ValueError,
+        ),
+        ({}, "get_pianoroll_from_barwise_intervals", {}, TypeError),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions - 1]},
+            "get_pianoroll_from_barwise_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions + 1]},
+            "get_pianoroll_from_barwise_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions]},
+            "get_pianoroll_from_barwise_intervals",
+            {"leading_silence": 2},
+            ValueError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions], "origin": 128},
+            "get_pianoroll_from_barwise_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions]},
+            "get_pianoroll_from_barwise_intervals",
+            {"origin": -1},
+            IndexError,
+        ),
+        (
+            {
+                "intervals": ZEROS[1, interval.feature_dimensions],
+                "default_velocity": 128,
+            },
+            "get_pianoroll_from_barwise_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions]},
+            "get_pianoroll_from_barwise_intervals",
+            {"velocity": -1},
+            IndexError,
+        ),
+        # chunk_sequence_of_intervals
+        ({}, "chunk_sequence_of_intervals", {}, TypeError),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions - 1]},
+            "chunk_sequence_of_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions + 1]},
+            "chunk_sequence_of_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {
+                "intervals": ZEROS[1, interval.feature_dimensions],
+                "pixels_per_bar": 0,
+            },
+            "chunk_sequence_of_intervals",
+            {},
+            ValueError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions]},
+            "chunk_sequence_of_intervals",
+            {"pixels_per_chunk": -1},
+            ValueError,
+        ),
+        # get_RLE_from_intervals
+        ({}, "get_RLE_from_intervals", {}, TypeError),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions - 1]},
+            "get_RLE_from_intervals",
+            {},
+            IndexError,
+        ),
+        (
+            {"intervals": ZEROS[1, interval.feature_dimensions + 1]},
+            "get_RLE_from_intervals",
+            {},
+            IndexError,
+        ),
+    ],
+)
+def test_invalid_argument_handling(attributes, method, kwargs, exception):
+    emb = embedder(**attributes)
+    with pytest.raises(exception):
+        getattr(emb, method)(**kwargs)
 
-    emb.intervals = np.zeros((1, interval.feature_dimensions - 1))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_melodic_intervals()
-
-    emb.intervals = np.zeros((1, interval.feature_dimensions + 1))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_melodic_intervals()
-
-    emb.intervals = np.zeros((1, interval.feature_dimensions))
-    with pytest.raises(ValueError):
-        emb.get_pianoroll_from_melodic_intervals(leading_silence=2)
-
-    emb.origin = 128
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_melodic_intervals()
-
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_melodic_intervals(origin=-1)
-
-    emb.default_velocity = 128
-    emb.intervals = np.zeros((1, interval.feature_dimensions))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_melodic_intervals()
-
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_melodic_intervals(velocity=-1)
-
-    # get_harmonic_intervals_from_pianoroll
-    emb.pianoroll = None
-    with pytest.raises(TypeError):
-        emb.get_harmonic_intervals_from_pianoroll(ref_pianoroll=np.zeros((1, 128)))
-
-    emb.pianoroll = np.zeros((1, 1))
-    with pytest.raises(IndexError):
-        emb.get_harmonic_intervals_from_pianoroll(ref_pianoroll=np.zeros((1, 128)))
-
-    emb.pianoroll = np.zeros((1, 150))
-    with pytest.raises(IndexError):
-        emb.get_harmonic_intervals_from_pianoroll(ref_pianoroll=np.zeros((1, 128)))
-
-    emb.pianoroll = np.zeros((1, 128))
-    with pytest.raises(IndexError):
-        emb.get_harmonic_intervals_from_pianoroll(ref_pianoroll=np.zeros((1, 1)))
-    with pytest.raises(IndexError):
-        emb.get_harmonic_intervals_from_pianoroll(ref_pianoroll=np.zeros((1, 150)))
-
-    # get_pianoroll_from_harmonic_intervals
-    emb.intervals = None
-    with pytest.raises(TypeError):
-        emb.get_pianoroll_from_harmonic_intervals()
-
-    emb.intervals = np.zeros((1, interval.feature_dimensions - 1))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_harmonic_intervals()
-
-    emb.intervals = np.zeros((1, interval.feature_dimensions + 1))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_harmonic_intervals()
-
-    emb.default_velocity = 128
-    emb.intervals = np.zeros((1, interval.feature_dimensions))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_harmonic_intervals()
-
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_harmonic_intervals(velocity=-1)
-
-    emb.pianoroll = None
-    with pytest.raises(TypeError):
-        emb.get_pianoroll_from_harmonic_intervals()
-
-    emb.pianoroll = np.zeros((1, 1))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_harmonic_intervals()
-
-    emb.pianoroll = np.zeros((1, 150))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_harmonic_intervals()
-
-    # get_barwise_intervals_from_pianoroll
-    emb.pianoroll = None
-    with pytest.raises(TypeError):
-        emb.get_barwise_intervals_from_pianoroll()
-
-    emb.pianoroll = np.zeros((1, 1))
-    with pytest.raises(IndexError):
-        emb.get_barwise_intervals_from_pianoroll()
-
-    emb.pianoroll = np.zeros((1, 150))
-    with pytest.raises(IndexError):
-        emb.get_barwise_intervals_from_pianoroll()
-
-    emb.pixels_per_bar = 0
-    emb.pianoroll = np.zeros((1, 128))
-    with pytest.raises(ValueError):
-        emb.get_barwise_intervals_from_pianoroll()
-
-    with pytest.raises(ValueError):
-        emb.get_barwise_intervals_from_pianoroll(pixels_per_bar=-1)
-
-    # get_pianoroll_from_barwise_intervals
-    emb.pixels_per_bar = 0
-    with pytest.raises(ValueError):
-        emb.get_pianoroll_from_barwise_intervals()
-
-    with pytest.raises(ValueError):
-        emb.get_pianoroll_from_barwise_intervals(pixels_per_bar=-1)
-
-    emb.intervals = None
-    emb.pixels_per_bar = 96
-    with pytest.raises(TypeError):
-        emb.get_pianoroll_from_barwise_intervals()
-
-    emb.intervals = np.zeros((1, interval.feature_dimensions - 1))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_barwise_intervals()
-
-    emb.intervals = np.zeros((1, interval.feature_dimensions + 1))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_barwise_intervals()
-
-    emb.intervals = np.zeros((1, interval.feature_dimensions))
-    with pytest.raises(ValueError):
-        emb.get_pianoroll_from_barwise_intervals(leading_silence=2)
 
-    emb.origin = 128
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_barwise_intervals()
-
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_barwise_intervals(origin=-1)
-
-    emb.default_velocity = 128
-    emb.intervals = np.zeros((1, interval.feature_dimensions))
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_barwise_intervals()
+def test_extract_highest_pitch_notes_from_pianoroll():
+    emb = embedder()
+    pianoroll = np.zeros((128, 128), dtype=np.int8)
+    idx = np.arange(128)
+    pianoroll[:, 0] = idx
+    pianoroll[idx, idx] = 127 - idx
+    emb.pianoroll = pianoroll
+    actual = emb.extract_highest_pitch_notes_from_pianoroll()
+    expected = np.arange(0, 128)
+    expected[-1] = 0
+    np.testing.assert_array_equal(actual, expected, verbose=True)
 
-    with pytest.raises(IndexError):
-        emb.get_pianoroll_from_barwise_intervals(velocity=-1)
 
-    # chunk_sequence_of_intervals
-    emb.intervals = None
-    with pytest.raises(TypeError):
-        emb.chunk_sequence_of_intervals()
+def test_extract_highest_pitch_notes_from_pianoroll_preserve_pianoroll_is_deprecated():
+    emb = embedder(pianoroll=np.zeros((1, 128), dtype=np.int8))
+    with pytest.warns(DeprecationWarning):
+        emb.extract_highest_pitch_notes_from_pianoroll(preserve_pianoroll=False)
 
-    emb.intervals = np.zeros((1, interval.feature_dimensions - 1))
-    with pytest.raises(IndexError):
-        emb.chunk_sequence_of_intervals()
 
-    emb.intervals = np.zeros((1, interval.feature_dimensions + 1))
-    with pytest.raises(IndexError):
-        emb.chunk_sequence_of_intervals()
+def test_interval_extraction_preserves_pianoroll():
+    pianoroll = np.zeros((96, 128), dtype=np.int8)
+    for i in range(96):
+        pianoroll[i, i % 12 + 48] = 100
+        pianoroll[i, i % 7 + 60] = 80
+    expected = pianoroll.copy()
+    pianoroll.setflags(write=False)
 
-    emb.pixels_per_bar = 0
-    emb.intervals = np.zeros((1, interval.feature_dimensions))
-    with pytest.raises(ValueError):
-        emb.chunk_sequence_of_intervals()
+    emb = embedder()
+    emb.get_melodic_intervals_from_pianoroll(pianoroll)
+    emb.get_harmonic_intervals_from_pianoroll(pianoroll, pianoroll)
+    emb.get_barwise_intervals_from_pianoroll(pianoroll, 12)
+    np.testing.assert_array_equal(pianoroll, expected, verbose=True)
 
-    with pytest.raises(ValueError):
-        emb.chunk_sequence_of_intervals(pixels_per_chunk=-1)
 
-    # get_RLE_from_intervals
-    emb.intervals = None
-    with pytest.raises(TypeError):
-        emb.get_RLE_from_intervals()
+def test_get_melodic_intervals_from_pianoroll(melodic_pianoroll):
+    emb = embedder()
+    actual = emb.get_melodic_intervals_from_pianoroll(melodic_pianoroll)
+    expected = np.zeros((128, 4), dtype=np.int8)
+    rows = [2, 5, 9, 14, 20, 27, 35, 44, 54, 65, 77, 90, 104, 119]
+    expected[rows] = [
+        [2, 1, 0, 0],
+        [3, -1, 0, 0],
+        [3, 1, 0, 0],
+        [4, 0, 0, 0],
+        [5, -2, 0, 0],
+        [5, 0, 0, 0],
+        [6, -1, 0, 0],
+        [6, 1, 0, 0],
+        [7, -1, 0, 0],
+        [7, 1, 0, 0],
+        [1, 0, 0, 1],
+        [2, -1, 0, 1],
+        [2, 1, 0, 1],
+        [3, -1, 0, 1],
+    ]
+    expected[120:] = [2, -1, 0, 0]
+    np.testing.assert_array_equal(actual, expected, verbose=True)
 
-    emb.intervals = np.zeros((1, interval.feature_dimensions - 1))
-    with pytest.raises(IndexError):
-        emb.get_RLE_from_intervals()
 
-    emb.intervals = np.zeros((1, interval.feature_dimensions + 1))
-    with pytest.raises(IndexError):
-        emb.get_RLE_from_intervals()
+def test_get_pianoroll_from_melodic_intervals(melodic_pianoroll):
+    emb = embedder()
+    intervals = emb.get_melodic_intervals_from_pianoroll(melodic_pianoroll)
+    actual = emb.get_pianoroll_from_melodic_intervals(intervals, origin=0)
+    np.testing.assert_array_equal(actual, melodic_pianoroll, verbose=True)
 
 
-def test_extract_highest_pitch_notes_from_pianoroll():
+def test_get_pianoroll_from_melodic_intervals_with_repeated_intervals():
     emb = embedder()
-    pianoroll = np.zeros((128, 128), dtype=np.int8)
-    for i in range(128):
-        pianoroll[i, 0] = i
-        pianoroll[i, i] = 127 - i
-    emb.pianoroll = pianoroll
-    actual = emb.extract_highest_pitch_notes_from_pianoroll()
-    expected = np.arange(0, 128)
-    expected[-1] = 0
+    expected = np.zeros((4, 128), dtype=np.int8)
+    for i in range(4):
+        expected[i, 60 + i] = 100
+
+    intervals = emb.get_melodic_intervals_from_pianoroll(expected)
+    actual = emb.get_pianoroll_from_melodic_intervals(intervals, origin=60)
     np.testing.assert_array_equal(actual, expected, verbose=True)
 
 
-def test_get_melodic_intervals_from_pianoroll():
+def test_get_harmonic_intervals_from_pianoroll():
     emb = embedder()
-    pianoroll = np.zeros((128, 128), dtype=np.int8)
-    for i in range(128):
+    pianoroll = np.zeros((15, 128), dtype=np.int8)
+    for i in range(2, 15):
+        pianoroll[i, 0] = 100
         pianoroll[i, i] = 100
-
-    csum = 0
-    for i in range(15):
-        csum += i
-        for j in range(i):
-            pianoroll[csum + j, csum + j] = 0
-
-    actual = emb.get_melodic_intervals_from_pianoroll(pianoroll)
+    actual = emb.get_harmonic_intervals_from_pianoroll(pianoroll, pianoroll)
     expected = np.asarray(
         [
             [0, 0, 0, 0],
             [0, 0, 0, 0],
             [2, 1, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [3, -1, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [3, 1, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [4, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [5, -2, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [5, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [6, -1, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [6, 1, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [7, -1, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [7, 1, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [1, 0, 0, 1],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [2, -1, 0, 1],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
             [2, 1, 0, 1],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [3, -1, 0, 1],
-            [2, -1, 0, 0],
-            [2, -1, 0, 0],
-            [2, -1, 0, 0],
-            [2, -1, 0, 0],
-            [2, -1, 0, 0],
-            [2, -1, 0, 0],
-            [2, -1, 0, 0],
-            [2, -1, 0, 0],
         ],
         dtype=np.int8,
     )
     np.testing.assert_array_equal(actual, expected, verbose=True)
 
 
-def test_get_pianoroll_from_melodic_intervals():
-    emb = embedder()
-    expected = np.zeros((128, 128), dtype=np.int8)
-    for i in range(128):
-        expected[i, i] = 100
-
-    csum = 0
-    for i in range(15):
-        csum += i
-        for j in range(i):
-            expected[csum + j, csum + j] = 0
-
-    intervals = emb.get_melodic_intervals_from_pianoroll(expected)
-    actual = emb.get_pianoroll_from_melodic_intervals(intervals, origin=0)
-    np.testing.assert_array_equal(actual, expected, verbose=True)
-
-
-def test_get_harmonic_intervals_from_pianoroll():
-    emb = embedder()
-    pianoroll = np.zeros((15, 128), dtype=np.int8)
-    for i in range(2, 15):
-        pianoroll[i, 0] = 100
-        pianoroll[i, i] = 100
-    actual = emb.get_harmonic_intervals_from_pianoroll(pianoroll, pianoroll)
-    expected = [
-        [0, 0, 0, 0],
-        [0, 0, 0, 0],
-        [2, 1, 0, 0],
-        [3, -1, 0, 0],
-        [3, 1, 0, 0],
-        [4, 0, 0, 0],
-        [5, -2, 0, 0],
-        [5, 0, 0, 0],
-        [6, -1, 0, 0],
-        [6, 1, 0, 0],
-        [7, -1, 0, 0],
-        [7, 1, 0, 0],
-        [1, 0, 0, 1],
-        [2, -1, 0, 1],
-        [2, 1, 0, 1],
-    ]
-    np.testing.assert_array_equal(actual, expected, verbose=True)
-
-
 def test_get_pianoroll_from_harmonic_intervals():
     emb = embedder()
     pianoroll = np.zeros((15, 128), dtype=np.int8)
@@ -466,11 +511,30 @@ def test_get_pianoroll_from_harmonic_intervals():
     np.testing.assert_array_equal(actual, expected, verbose=True)
 
 
+def test_get_pianoroll_from_harmonic_intervals_with_silent_intervals():
+    emb = embedder()
+    ref_pianoroll = np.zeros((4, 128), dtype=np.int8)
+    ref_pianoroll[:, 60] = 100
+    intervals = np.asarray(
+        [[3, 1, 0, 0], [0, 0, 0, 0], [5, 0, 1, 0], [0, 0, 0, 0]], dtype=np.int8
+    )
+
+    expected = np.zeros((4, 128), dtype=np.int8)
+    expected[0, 64] = 100
+    expected[2, 53] = 100
+
+    actual = emb.get_pianoroll_from_harmonic_intervals(
+        pianoroll=ref_pianoroll, intervals=intervals
+    )
+    np.testing.assert_array_equal(actual, expected, verbose=True)
+
+
+@pytest.mark.slow
 def test_barwise_embedding():
     emb = embedder()
     expected = np.zeros((128 * 12, 128), dtype=np.int8)
-    for i in range(1, 128 * 12):
-        expected[i, i % 64 + 32] = 100
+    rows = np.arange(1, 128 * 12)
+    expected[rows, rows % 64 + 32] = 100
 
     intervals = emb.get_barwise_intervals_from_pianoroll(expected, 96)
     actual = emb.get_pianoroll_from_barwise_intervals(
@@ -479,27 +543,58 @@ def test_barwise_embedding():
     np.testing.assert_array_equal(actual, expected, verbose=True)
 
 
-def test_chunk():
+def test_chunk(random_intervals):
     emb = embedder()
-    expected = np.random.randint(low=-2, high=2, size=(960, 4), dtype=np.int8)
+    expected = random_intervals
     chunked_intervals = emb.chunk_sequence_of_intervals(expected)
     actual = emb.merge_chunked_intervals(chunked_intervals)
     np.testing.assert_array_equal(actual, expected, verbose=True)
+    assert np.shares_memory(chunked_intervals, expected)
+
+    with pytest.warns(UserWarning, match="C-contiguous"):
+        chunked_intervals = emb.chunk_sequence_of_intervals(expected[::-1])
+    np.testing.assert_array_equal(chunked_intervals.reshape(-1, 4), expected[::-1])
+    with pytest.warns(UserWarning, match="C-contiguous"):
+        emb.merge_chunked_intervals(chunked_intervals[::-1])
+
+
+def test_get_overlapping_chunks_of_intervals():
+    emb = embedder()
+    intervals = np.random.default_rng(SEED).integers(
+        low=-2, high=2, size=(10, 4), dtype=np.int8
+    )
+    actual = emb.get_overlapping_chunks_of_intervals(
+        intervals, pixels_per_chunk=4, hop_size=3
+    )
+    expected = np.stack([intervals[0:4], intervals[3:7], intervals[6:10]])
+    np.testing.assert_array_equal(actual, expected, verbose=True)
 
+    with pytest.raises(ValueError):
+        emb.get_overlapping_chunks_of_intervals(intervals, pixels_per_chunk=0)
+    with pytest.raises(ValueError):
+        emb.get_overlapping_chunks_of_intervals(intervals, hop_size=0)
 
-def test_RLE():
+
+def test_RLE(random_intervals):
     emb = embedder()
-    expected = np.random.randint(low=-2, high=2, size=(960, 4), dtype=np.int8)
+    expected = random_intervals
     RLE = emb.get_RLE_from_intervals(expected)
     actual = emb.get_intervals_from_RLE(RLE)
     np.testing.assert_array_equal(actual, expected, verbose=True)
 
 
-def test_RLE_bulk():
+def test_RLE_bulk(random_intervals):
     emb = embedder()
-    expected = np.random.randint(low=-2, high=2, size=(960, 4), dtype=np.int8)
+    expected = random_intervals
     chunked_intervals = emb.chunk_sequence_of_intervals(expected)
     RLE_bulk = emb.get_RLE_from_intervals_bulk(chunked_intervals)
     intervals_bulk = emb.get_intervals_from_RLE_bulk(RLE_bulk)
     actual = emb.merge_chunked_intervals(intervals_bulk)
     np.testing.assert_array_equal(actual, expected, verbose=True)
+
+    assert emb.get_RLE_from_intervals_bulk(np.zeros((0, 5, 4), dtype=np.int8)) == []
+    assert emb.get_intervals_from_RLE_bulk([]).shape == (0, 0, 4)
+    with pytest.raises(ValueError):
+        emb.get_intervals_from_RLE_bulk(
+            [np.array([[1, 0, 0, 0, 1]]), np.array([[2, 0, 0, 0, 3]])]
+        )
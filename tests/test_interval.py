@@ -1,103 +1,207 @@
 from music_embedding.interval import interval
+import numpy as np
 import pytest
 
+SPECS = np.array(
+    [
+        [1, 0, 0, 0],
+        [2, -1, 0, 0],
+        [2, 1, 0, 0],
+        [3, -1, 0, 0],
+        [3, 1, 0, 0],
+        [4, 0, 0, 0],
+        [5, -2, 0, 0],
+        [5, 0, 0, 0],
+        [6, -1, 0, 0],
+        [6, 1, 0, 0],
+        [7, -1, 0, 0],
+        [7, 1, 0, 0],
+        [0, 0, 0, 1],
+        [0, 0, 1, 1],
+    ],
+    dtype=np.int8,
+)
+EXPECTED = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, -12], dtype=np.int8)
 
-def test_interval2semitone():
-    assert interval().interval2semitone([1, 0, 0, 0]) == 0
-    assert interval().interval2semitone([2, -1, 0, 0]) == 1
-    assert interval().interval2semitone([2, 1, 0, 0]) == 2
-    assert interval().interval2semitone([3, -1, 0, 0]) == 3
-    assert interval().interval2semitone([3, 1, 0, 0]) == 4
-    assert interval().interval2semitone([4, 0, 0, 0]) == 5
-    assert interval().interval2semitone([5, -2, 0, 0]) == 6
-    assert interval().interval2semitone([5, 0, 0, 0]) == 7
-    assert interval().interval2semitone([6, -1, 0, 0]) == 8
-    assert interval().interval2semitone([6, 1, 0, 0]) == 9
-    assert interval().interval2semitone([7, -1, 0, 0]) == 10
-    assert interval().interval2semitone([7, 1, 0, 0]) == 11
-    assert interval().interval2semitone([0, 0, 0, 1]) == 12
-    assert interval().interval2semitone([0, 0, 1, 1]) == -12
-    expected = [
-        -1,
-        0,
-        0,
-        0,
-        1,
-        0,
-        1,
-        2,
-        2,
-        3,
-        2,
-        3,
-        4,
-        4,
-        5,
-        4,
-        5,
-        5,
-        5,
-        6,
-        6,
-        7,
-        7,
-        7,
-        8,
-        7,
-        8,
-        9,
-        9,
-        10,
-        9,
-        10,
-        11,
-        11,
-        12,
-    ]
-    cnt = 0
-    for order in range(1, 8):
-        for ttype in range(-2, 3):
-            assert interval().interval2semitone([order, ttype, 0, 0]) == expected[cnt]
-            cnt += 1
-
-
-def test_semitone2interval():
+# semitones of every interval_order (1-7) and interval_type (-2 to 2) pair, including faulty ones
+EXPECTED_SEMITONES = (
+    -1,
+    0,
+    0,
+    0,
+    1,
+    0,
+    1,
+    2,
+    2,
+    3,
+    2,
+    3,
+    4,
+    4,
+    5,
+    4,
+    5,
+    5,
+    5,
+    6,
+    6,
+    7,
+    7,
+    7,
+    8,
+    7,
+    8,
+    9,
+    9,
+    10,
+    9,
+    10,
+    11,
+    11,
+    12,
+)
+
+# names of the intervals from -1 to 12 semitones
+EXPECTED_NAMES = (
+    "Descending min 2nd",
+    "perfect 1st",
+    "min 2nd",
+    "Maj 2nd",
+    "min 3rd",
+    "Maj 3rd",
+    "perfect 4th",
+    "dim 5th",
+    "perfect 5th",
+    "min 6th",
+    "Maj 6th",
+    "min 7th",
+    "Maj 7th",
+    "perfect 8th",
+)
+
+# one value out of range per field, on both sides
+BAD_SPECS = (
+    [-1, 0, 0, 0],
+    [8, 0, 0, 0],
+    [0, -3, 0, 0],
+    [0, 3, 0, 0],
+    [0, 0, -1, 0],
+    [0, 0, 2, 0],
+    [0, 0, 0, -1],
+    [0, 0, 0, 10],
+    np.array([8, 0, 0, 0], dtype=np.uint8),
+    np.array([1, 0, 0, 10], dtype=np.uint8),
+    [8.0, 0, 0, 0],
+    np.array([1, 0, 0, 9.5], dtype=np.float32),
+)
+
+CASES = [
+    (order, ttype, semitones)
+    for (order, ttype), semitones in zip(
+        ((order, ttype) for order in range(1, 8) for ttype in range(-2, 3)),
+        EXPECTED_SEMITONES,
+    )
+]
+
+
+@pytest.fixture(scope="module")
+def iv():
+    return interval()
+
+
+@pytest.fixture(scope="session")
+def silence_specs():
+    return tuple(interval().get_silence_specs_list())
+
+
+def test_interval2semitone(iv):
+    np.testing.assert_array_equal(interval.intervals2semitones(SPECS), EXPECTED)
+    np.testing.assert_array_equal(
+        [iv.interval2semitone(specs) for specs in SPECS.tolist()], EXPECTED
+    )
+
+
+@pytest.mark.parametrize(("order", "ttype", "expected"), CASES)
+def test_interval2semitone_grid(iv, order, ttype, expected):
+    assert iv.interval2semitone([order, ttype, 0, 0]) == expected
+
+
+def test_semitone2interval(iv):
+    semitones = np.arange(-30, 30)
+    np.testing.assert_array_equal(
+        [iv.interval2semitone(iv.semitone2interval(int(i))) for i in semitones],
+        semitones,
+    )
+    assert iv.semitone2interval(7.0) == iv.semitone2interval(7)
+    assert iv.semitone2interval(np.float64(-19.0)) == iv.semitone2interval(-19)
+
+
+def test_semitone2interval_returns_ints():
+    interval_obj = interval()
+    interval_obj.semitone2interval(np.int8(-5))
+    assert all(type(spec) is int for spec in interval_obj.get_specs_list())
+    assert interval_obj.get_name(np.int64(-5)) == "Descending perfect 4th"
+    assert all(type(spec) is int for spec in interval_obj.get_specs_list())
+
+
+def test_semitone2interval_keeps_semitones():
+    interval_obj = interval(semitones=-14)
+    first = interval_obj.semitone2interval()
+    assert interval_obj.semitones == -14
+    assert interval_obj.semitone2interval() == first
+
+
+def test_semitone2interval_without_dict():
+    interval_obj = interval()
     for i in range(-30, 30):
-        assert interval().interval2semitone(interval().semitone2interval(i)) == i
+        specs = interval_obj.semitone2interval(i, return_dict=False)
+        assert specs._asdict() == interval().semitone2interval(i)
+        assert interval().interval2semitone(specs) == i
+
+
+def test_semitones2intervals():
+    semitones = np.arange(-30, 30)
+    intervals = interval.semitones2intervals(semitones)
+    assert intervals.dtype == np.int8
+    assert intervals.shape == (len(semitones), interval.feature_dimensions)
+    for i, specs in zip(semitones, intervals):
+        interval_obj = interval()
+        interval_obj.semitone2interval(int(i))
+        assert specs.tolist() == interval_obj.get_specs_list()
+
+
+def test_intervals2semitones():
+    semitones = np.arange(-30, 30)
+    np.testing.assert_array_equal(
+        interval.intervals2semitones(interval.semitones2intervals(semitones)),
+        semitones,
+    )
+    with pytest.raises(ValueError):
+        interval.intervals2semitones([[1, 0, 0, 0], [8, 0, 0, 0]])
 
 
-def test_is_silence():
+def test_is_silence(silence_specs):
     interval_obj = interval()
-    interval_obj.set_specs_list(interval_obj.get_silence_specs_list())
+    interval_obj.set_specs_list(list(silence_specs))
     assert interval_obj.is_silence()
 
 
+def test_set_specs_list_accepts_floats(iv):
+    assert iv.interval2semitone([5.0, 0, 0, 1.0]) == 19
+    assert iv.interval2semitone(np.array([3, 1, 1, 0], dtype=np.float32)) == -4
+
+
 def test_get_specs_list():
     interval_obj = interval()
     interval_obj.set_specs_list([3, 2, 1, 0])
     assert interval_obj.get_specs_list() == [3, 2, 1, 0]
 
 
-def test_set_specs_list():
-    with pytest.raises(ValueError):
-        interval().interval2semitone([-1, 0, 0, 0])
-    with pytest.raises(ValueError):
-        interval().interval2semitone([8, 0, 0, 0])
-
-    with pytest.raises(ValueError):
-        interval().interval2semitone([0, -3, 0, 0])
-    with pytest.raises(ValueError):
-        interval().interval2semitone([0, 3, 0, 0])
-
-    with pytest.raises(ValueError):
-        interval().interval2semitone([0, 0, -1, 0])
-    with pytest.raises(ValueError):
-        interval().interval2semitone([0, 0, 2, 0])
-
-    with pytest.raises(ValueError):
-        interval().interval2semitone([0, 0, 0, -1])
+@pytest.mark.parametrize("spec", BAD_SPECS)
+def test_set_specs_list_rejects(iv, spec):
     with pytest.raises(ValueError):
-        interval().interval2semitone([0, 0, 0, 10])
+        iv.interval2semitone(spec)
 
 
 def test_get_one_hot_specs_list():
@@ -112,41 +216,80 @@ def test_get_one_hot_specs_list():
     assert interval_obj.get_one_hot_specs_list() == expected
 
 
+def test_intervals2one_hot():
+    intervals = interval.semitones2intervals(np.arange(-30, 30))
+    one_hot = interval.intervals2one_hot(intervals)
+    assert one_hot.shape == (len(intervals), 14)
+    for specs, row in zip(intervals, one_hot):
+        interval_obj = interval()
+        interval_obj.set_specs_list(specs.tolist())
+        expected = interval_obj.get_one_hot_specs_list()
+        assert row[:7].tolist() == expected["interval_order"]
+        assert row[7:12].tolist() == expected["interval_type"]
+        assert row[12:].tolist() == [
+            expected["is_descending"],
+            expected["octave_offset"],
+        ]
+
+
+def test_one_hot2intervals():
+    intervals = interval.semitones2intervals(np.arange(-30, 30))
+    assert np.array_equal(
+        interval.one_hot2intervals(interval.intervals2one_hot(intervals)), intervals
+    )
+    one_hot = interval.intervals2one_hot([[1, 0, 0, 0]])
+    one_hot[0, 13] = 10
+    with pytest.raises(ValueError):
+        interval.one_hot2intervals(one_hot)
+    for specs in ([0, -3, 0, 0], [1, 0, 0, -1], [9, 0, 0, 0]):
+        with pytest.raises(ValueError):
+            interval.intervals2one_hot([specs])
+
+
 def test_set_one_hot_specs_list():
     interval_obj = interval()
     interval_obj.set_one_hot_specs_list([0, 0, 1, 0, 0, 0, 0], [0, 0, 0, 0, 1], 1, 0)
     assert interval_obj.get_specs_list() == [3, 2, 1, 0]
 
+    interval_obj.set_one_hot_specs_list(
+        [0.2, 1, 3, 0, 0, 0, 0], [0.1, 1, 0.4, 0.9, 0.3], 0, 1
+    )
+    assert interval_obj.get_specs_list() == [3, -1, 0, 1]
+    interval_obj.set_one_hot_specs_list(
+        np.array([0, 1, 0.5, 0, 0, 0, 0]), (0.1, 0.2, 0.4, 0.9, 0.3), 0, 0
+    )
+    assert interval_obj.get_specs_list() == [2, 1, 0, 0]
+
 
-def test_get_silence_specs_list():
+def test_get_silence_specs_list(silence_specs):
     interval_obj = interval()
-    interval_obj.set_specs_list(interval_obj.get_silence_specs_list())
+    assert interval_obj.get_silence_specs_list() == list(silence_specs)
+    interval_obj.set_specs_list(list(silence_specs))
     assert interval_obj.is_silence()
 
 
-def test_get_name():
+def test_array():
+    intervals = [interval(), interval()]
+    intervals[1].semitone2interval(-15)
+    assert np.asarray(intervals[1]).tolist() == [3, -1, 1, 1]
+    specs = np.array(intervals)
+    assert specs.dtype == np.int8
+    assert np.array_equal(interval.intervals2semitones(specs), [0, -15])
+    with pytest.raises(ValueError):
+        np.asarray(intervals[1], copy=False)
+
+
+def test_get_name(silence_specs):
     interval_obj = interval()
-    interval_obj.set_specs_list(interval_obj.get_silence_specs_list())
+    interval_obj.set_specs_list(list(silence_specs))
     assert str(interval_obj) == "Silence"
 
-    expected = [
-        "Descending min 2nd",
-        "perfect 1st",
-        "min 2nd",
-        "Maj 2nd",
-        "min 3rd",
-        "Maj 3rd",
-        "perfect 4th",
-        "dim 5th",
-        "perfect 5th",
-        "min 6th",
-        "Maj 6th",
-        "min 7th",
-        "Maj 7th",
-        "perfect 8th",
-    ]
     for i in range(-1, 13):
-        assert interval_obj.get_name(i) == expected[i + 1]
+        assert interval_obj.get_name(i) == EXPECTED_NAMES[i + 1]
 
     interval_obj.set_specs_list([5, 2, 0, 0])
     assert interval_obj.get_name() == "Aug 5th"
+
+    assert interval_obj.get_name(127) == "perfect 75th"
+    assert interval_obj.get_name(-127) == "Descending perfect 75th"
+    assert interval_obj.get_name(120) == "perfect 71st"